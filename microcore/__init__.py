@@ -28,6 +28,18 @@ def tpl(file: os.PathLike[str] | str, **kwargs) -> str | PromptWrapper:
     return PromptWrapper(env().tpl_function(file, **kwargs), kwargs)
 
 
+def _tpl_cache_clear():
+    """
+    Clears cache of rendered templates,
+    see `microcore.config.Config.PROMPT_TEMPLATES_CACHE`
+    """
+    if hasattr(env().tpl_function, "cache_clear"):
+        env().tpl_function.cache_clear()
+
+
+tpl.cache_clear = _tpl_cache_clear
+
+
 def prompt(template_str: str, remove_indent=True, **kwargs) -> str | PromptWrapper:
     """Renders a prompt template from string using the provided parameters."""
     if remove_indent:
@@ -70,6 +82,16 @@ class _EmbeddingDBProxy(AbstractEmbeddingDB):
     ) -> SearchResults | list[str | SearchResult]:
         return env().texts.search(collection, query, n_results, where, **kwargs)
 
+    def search_many(
+        self,
+        collection: str,
+        queries: list[str],
+        n_results: int = 5,
+        where: dict = None,
+        **kwargs,
+    ) -> list[SearchResults | list[str | SearchResult]]:
+        return env().texts.search_many(collection, queries, n_results, where, **kwargs)
+
     def find(self, *args, **kwargs) -> SearchResults | list[str | SearchResult]:
         return self.search(*args, **kwargs)
 
@@ -82,7 +104,11 @@ class _EmbeddingDBProxy(AbstractEmbeddingDB):
     ) -> SearchResults | list[str | SearchResult]:
         return env().texts.find_all(collection, query, where, **kwargs)
 
-    def save_many(self, collection: str, items: list[tuple[str, dict] | str]):
+    def save_many(
+        self,
+        collection: str,
+        items: list[tuple[str, dict] | tuple[str, dict, str] | str],
+    ):
         return env().texts.save_many(collection, items)
 
     def save(self, collection: str, text: str, metadata: dict = None):
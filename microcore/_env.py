@@ -128,6 +128,13 @@ class Env:
                 self.config
             )
 
+        if self.config.LLM_CACHE_ENABLED:
+            from ._llm_cache import make_cached_llm_functions
+
+            self.llm_function, self.llm_async_function = make_cached_llm_functions(
+                self, self.llm_function, self.llm_async_function
+            )
+
     def init_similarity_search(self):
         if find_spec("chromadb") is not None:
             from .embedding_db.chromadb import ChromaEmbeddingDB
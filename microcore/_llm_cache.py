@@ -0,0 +1,153 @@
+"""
+Caching of LLM responses, see `microcore.config.Config.LLM_CACHE_ENABLED`
+"""
+
+import asyncio
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING
+
+from .types import LLMAsyncFunctionType, LLMFunctionType, TPrompt
+from .wrappers.llm_response_wrapper import LLMResponse
+
+if TYPE_CHECKING:
+    from ._env import Env  # noqa: F401
+
+SEMANTIC_CACHE_COLLECTION = "llm_response_cache"
+"""Embedding database collection used for the semantic cache"""
+
+EXACT_CACHE_SIZE = 1024
+"""Max. number of responses kept in memory for exact matches (least recently used are evicted)"""
+
+
+def _hash(data: str) -> str:
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+
+def _prompt_to_text(prompt: TPrompt) -> str:
+    if isinstance(prompt, str):
+        return str(prompt)
+    return json.dumps(prompt, sort_keys=True, ensure_ascii=False)
+
+
+def make_cached_llm_functions(
+    env: "Env",
+    llm_function: LLMFunctionType,
+    llm_async_function: LLMAsyncFunctionType,
+) -> tuple[LLMFunctionType, LLMAsyncFunctionType]:
+    """
+    Wraps LLM functions with the response cache.
+    Exact matches are looked up in memory (up to EXACT_CACHE_SIZE recent responses),
+    similar prompts are looked up in the embedding database
+    if `microcore.config.Config.LLM_CACHE_SEMANTIC_MAX_DISTANCE` is set.
+    Requests with streaming callbacks are not cached.
+    """
+    cache: OrderedDict[str, str] = OrderedDict()
+    cache_lock = threading.Lock()
+    config = env.config
+
+    def cache_context(kwargs: dict) -> str | None:
+        if kwargs.get("callback") or kwargs.get("callbacks"):
+            return None
+        try:
+            return _hash(
+                json.dumps(
+                    [
+                        config.LLM_API_TYPE,
+                        config.MODEL,
+                        config.LLM_DEFAULT_ARGS,
+                        kwargs,
+                    ],
+                    sort_keys=True,
+                )
+            )
+        except TypeError:
+            return None
+
+    def semantic_max_distance() -> float | None:
+        distance = config.LLM_CACHE_SEMANTIC_MAX_DISTANCE
+        if distance is None or distance == "" or env.texts is None:
+            return None
+        return float(distance)
+
+    def lookup(key: str) -> LLMResponse | None:
+        with cache_lock:
+            cached = cache.get(key)
+            if cached is not None:
+                cache.move_to_end(key)
+        if cached is None:
+            return None
+        return LLMResponse(cached, {"from_cache": True})
+
+    def store(key: str, response: str):
+        with cache_lock:
+            cache[key] = str(response)
+            cache.move_to_end(key)
+            if len(cache) > EXACT_CACHE_SIZE:
+                cache.popitem(last=False)
+
+    def semantic_lookup(
+        prompt_text: str, context: str, max_distance: float
+    ) -> LLMResponse | None:
+        found = next(
+            iter(
+                env.texts.search(
+                    SEMANTIC_CACHE_COLLECTION,
+                    prompt_text,
+                    1,
+                    where={"context": context},
+                )
+            ),
+            None,
+        )
+        if found is None or found.distance > max_distance:
+            return None
+        return LLMResponse(found.metadata["response"], {"from_cache": True})
+
+    def semantic_store(key: str, prompt_text: str, context: str, response: str):
+        # Explicit id: the same prompt within other contexts is stored separately
+        env.texts.save_many(
+            SEMANTIC_CACHE_COLLECTION,
+            [(prompt_text, {"context": context, "response": str(response)}, key)],
+        )
+
+    def cached_llm(prompt: TPrompt, **kwargs) -> str | LLMResponse:
+        if (context := cache_context(kwargs)) is None:
+            return llm_function(prompt, **kwargs)
+        prompt_text = _prompt_to_text(prompt)
+        key = _hash(context + prompt_text)
+        if (response := lookup(key)) is not None:
+            return response
+        if (max_distance := semantic_max_distance()) is not None:
+            response = semantic_lookup(prompt_text, context, max_distance)
+            if response is not None:
+                return response
+        response = llm_function(prompt, **kwargs)
+        store(key, response)
+        if max_distance is not None:
+            semantic_store(key, prompt_text, context, response)
+        return response
+
+    async def cached_allm(prompt: TPrompt, **kwargs) -> str | LLMResponse:
+        if (context := cache_context(kwargs)) is None:
+            return await llm_async_function(prompt, **kwargs)
+        prompt_text = _prompt_to_text(prompt)
+        key = _hash(context + prompt_text)
+        if (response := lookup(key)) is not None:
+            return response
+        # Embedding database calls are blocking, run them outside the event loop
+        if (max_distance := semantic_max_distance()) is not None:
+            response = await asyncio.to_thread(
+                semantic_lookup, prompt_text, context, max_distance
+            )
+            if response is not None:
+                return response
+        response = await llm_async_function(prompt, **kwargs)
+        store(key, response)
+        if max_distance is not None:
+            await asyncio.to_thread(semantic_store, key, prompt_text, context, response)
+        return response
+
+    return cached_llm, cached_allm
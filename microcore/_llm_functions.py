@@ -106,11 +106,10 @@ async def llm_parallel(
 
     Returns (list[LLMResponse | str]): a list of responses in the same order as the prompts
     """
-    tasks = [allm(prompt, **kwargs) for prompt in prompts]
-
     if max_concurrent_tasks is None:
-        max_concurrent_tasks = int(env().config.MAX_CONCURRENT_TASKS)
+        max_concurrent_tasks = int(env().config.MAX_CONCURRENT_TASKS or 0)
     if not max_concurrent_tasks:
-        max_concurrent_tasks = len(tasks)
+        max_concurrent_tasks = len(prompts)
 
+    tasks = [allm(prompt, **kwargs) for prompt in prompts]
     return await run_parallel(tasks, max_concurrent_tasks=max_concurrent_tasks)
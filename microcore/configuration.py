@@ -347,6 +347,13 @@ class Config(LLMConfig):
     PROMPT_TEMPLATES_PATH: str | Path = from_env("tpl")
     """Path to the folder with prompt templates, ./tpl by default"""
 
+    PROMPT_TEMPLATES_CACHE: bool = from_env(dtype=bool, default=False)
+    """
+    Cache rendered templates for repeated calls with the same parameters.
+    Only calls with str, int, float, bool, None or tuple parameters are cached;
+    edited template files are not re-read until `microcore.tpl.cache_clear()`.
+    """
+
     STORAGE_PATH: str | Path = from_env("storage")
     """Path to the folder with file storage, ./storage by default"""
 
@@ -359,6 +366,19 @@ class Config(LLMConfig):
 
     EMBEDDING_DB_ALLOW_DUPLICATES: bool = from_env(dtype=bool, default=False)
 
+    EMBEDDING_DB_USE_GPU: bool = from_env(dtype=bool, default=False)
+    """
+    Run the default embedding model on GPU (CUDA / ROCm) if available.
+    Not applied when microcore.config.Config.EMBEDDING_DB_FUNCTION is set.
+    """
+
+    EMBEDDING_DB_HNSW_PARAMS: dict = from_env(dtype=dict)
+    """
+    Vector index parameters applied to new collections,
+    e.g. {"space": "cosine", "M": 32, "construction_ef": 200, "search_ef": 50}.
+    See https://docs.trychroma.com/guides#changing-the-distance-function
+    """
+
     DEFAULT_ENCODING: str = from_env("utf-8")
     """Used in file system operations, utf-8 by default"""
 
@@ -371,6 +391,15 @@ class Config(LLMConfig):
 
     MAX_CONCURRENT_TASKS: int = from_env(default=None)
 
+    LLM_CACHE_ENABLED: bool = from_env(dtype=bool, default=False)
+    """Reuse LLM responses for repeated requests with the same prompt and arguments"""
+
+    LLM_CACHE_SEMANTIC_MAX_DISTANCE: float = from_env()
+    """
+    If set, cached responses are also reused for similar prompts
+    within this embedding distance (requires embedding database, see `microcore.texts`)
+    """
+
     SAVE_MEMORY: bool = from_env(dtype=bool, default=False)
     """
     Some additional data will not be collected:
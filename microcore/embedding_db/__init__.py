@@ -77,6 +77,34 @@ class AbstractEmbeddingDB(ABC):
             **kwargs: additional arguments
         """
 
+    def search_many(
+        self,
+        collection: str,
+        queries: list[str],
+        n_results: int = 5,
+        where: dict = None,
+        **kwargs,
+    ) -> list[SearchResults | list[str | SearchResult]]:
+        """
+        Similarity search for multiple queries
+
+        Implementations may override it to process all queries in a single batch.
+
+        Args:
+            collection (str): collection name
+            queries (list[str]): query strings
+            n_results (int): number of results to return for each query
+            where (dict): filter results by metadata
+            **kwargs: additional arguments
+
+        Returns:
+            List of search results for each query, in the same order as the queries
+        """
+        return [
+            self.search(collection, query, n_results, where, **kwargs)
+            for query in queries
+        ]
+
     def find(self, *args, **kwargs) -> SearchResults | list[str | SearchResult]:
         """
         Alias for `search`
@@ -103,8 +131,15 @@ class AbstractEmbeddingDB(ABC):
         self.save_many(collection, [(text, metadata)])
 
     @abstractmethod
-    def save_many(self, collection: str, items: list[tuple[str, dict] | str]):
-        """Save multiple documents in the collection"""
+    def save_many(
+        self,
+        collection: str,
+        items: list[tuple[str, dict] | tuple[str, dict, str] | str],
+    ):
+        """
+        Save multiple documents in the collection.
+        Items are texts, (text, metadata) or (text, metadata, document id) tuples.
+        """
 
     @abstractmethod
     def clear(self, collection: str):
@@ -1,3 +1,4 @@
+import logging
 from dataclasses import dataclass
 import uuid
 
@@ -22,23 +23,42 @@ class ChromaEmbeddingDB(AbstractEmbeddingDB):
             settings=Settings(anonymized_telemetry=False),
         )
         self.embedding_function = (
-            self.config.EMBEDDING_DB_FUNCTION
-            or embedding_functions.DefaultEmbeddingFunction()
+            self.config.EMBEDDING_DB_FUNCTION or self._default_embedding_function()
         )
 
+    def _default_embedding_function(self) -> embedding_functions.EmbeddingFunction:
+        if self.config.EMBEDDING_DB_USE_GPU:
+            import onnxruntime  # pylint: disable=import-outside-toplevel
+
+            available = onnxruntime.get_available_providers()
+            gpu_providers = [
+                p
+                for p in ("CUDAExecutionProvider", "ROCMExecutionProvider")
+                if p in available
+            ]
+            if gpu_providers:
+                # pylint: disable-next=no-member
+                return embedding_functions.ONNXMiniLM_L6_V2(
+                    preferred_providers=gpu_providers + ["CPUExecutionProvider"]
+                )
+            logging.warning("EMBEDDING_DB_USE_GPU: no GPU execution providers found")
+        return embedding_functions.DefaultEmbeddingFunction()
+
     @classmethod
-    def _wrap_results(cls, results) -> list[str | SearchResult]:
+    def _wrap_results(cls, results, query_index: int = 0) -> list[str | SearchResult]:
+        if not results or not results.get("documents"):
+            return SearchResults([])
         return SearchResults(
             [
                 SearchResult(
-                    results["documents"][0][i],
+                    results["documents"][query_index][i],
                     dict(
-                        metadata=results["metadatas"][0][i] or {},
-                        id=results["ids"][0][i],
-                        distance=results["distances"][0][i],
+                        metadata=results["metadatas"][query_index][i] or {},
+                        id=results["ids"][query_index][i],
+                        distance=results["distances"][query_index][i],
                     ),
                 )
-                for i in range(len(results["documents"][0]))
+                for i in range(len(results["documents"][query_index]))
             ]
         )
 
@@ -59,30 +79,61 @@ class ChromaEmbeddingDB(AbstractEmbeddingDB):
         d = self._get_collection(collection).query(
             query_texts=query, n_results=n_results, where=where, **kwargs
         )
-        return (
-            self._wrap_results(d)
-            if d and d.get("documents") and d["documents"][0]
-            else SearchResults([])
+        return self._wrap_results(d)
+
+    def search_many(
+        self,
+        collection: str,
+        queries: list[str],
+        n_results: int = 5,
+        where: dict = None,
+        **kwargs,
+    ) -> list[SearchResults | list[str | SearchResult]]:
+        if not queries:
+            return []
+        if not self.collection_exists(collection):
+            return [SearchResults([]) for _ in queries]
+
+        d = self._get_collection(collection).query(
+            query_texts=queries, n_results=n_results, where=where, **kwargs
         )
+        return [self._wrap_results(d, i) for i in range(len(queries))]
+
+    def _default_doc_id(self, text: str) -> str:
+        if self.config.EMBEDDING_DB_ALLOW_DUPLICATES:
+            return str(uuid.uuid4())
+        return str(hash(text))
 
-    def save_many(self, collection: str, items: list[tuple[str, dict] | str]):
-        unique = not self.config.EMBEDDING_DB_ALLOW_DUPLICATES
+    def save_many(
+        self,
+        collection: str,
+        items: list[tuple[str, dict] | tuple[str, dict, str] | str],
+    ):
         texts, ids, metadatas = [], [], []
+        seen = set()
         for i in items:
             if isinstance(i, str):
-                text = i
-                metadata = None
+                text, metadata, doc_id = i, None, None
             else:
-                text = i[0]
-                metadata = i[1] or None
-            if unique and text in texts:
+                text, metadata = i[0], i[1] or None
+                doc_id = i[2] if len(i) > 2 else None
+            doc_id = doc_id or self._default_doc_id(text)
+            if doc_id in seen:
                 continue
+            seen.add(doc_id)
             texts.append(text)
             metadatas.append(metadata)
-            ids.append(str(hash(text)) if unique else str(uuid.uuid4()))
-        self._get_collection(collection, create=True).upsert(
-            documents=texts, ids=ids, metadatas=metadatas
-        )
+            ids.append(doc_id)
+        chroma_collection = self._get_collection(collection, create=True)
+        # Documents are embedded and stored in batches as large as the client allows
+        batch_size = self._max_batch_size() or len(texts) or 1
+        for start in range(0, len(texts), batch_size):
+            end = start + batch_size
+            chroma_collection.upsert(
+                documents=texts[start:end],
+                ids=ids[start:end],
+                metadatas=metadatas[start:end],
+            )
 
     def clear(self, collection: str):
         try:
@@ -125,13 +176,24 @@ class ChromaEmbeddingDB(AbstractEmbeddingDB):
             ]
         )
 
+    def _max_batch_size(self) -> int | None:
+        if hasattr(self.client, "get_max_batch_size"):
+            return self.client.get_max_batch_size()
+        return getattr(self.client, "max_batch_size", None)
+
     def collection_exists(self, collection: str) -> bool:
         return self._get_collection(collection) is not None
 
     def _get_collection(self, name: str, create: bool = False):
         if create:
             return self.client.get_or_create_collection(
-                name=name, embedding_function=self.embedding_function
+                name=name,
+                embedding_function=self.embedding_function,
+                metadata={
+                    f"hnsw:{k}": v
+                    for k, v in self.config.EMBEDDING_DB_HNSW_PARAMS.items()
+                }
+                or None,
             )
         try:
             return self.client.get_collection(
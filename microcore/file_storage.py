@@ -2,17 +2,212 @@
 File storage functions
 """
 
+import codecs
+import errno
 import fnmatch
+import io
 import json
+import mmap
 import os
+import re
 import shutil
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-import chardet
+from typing import Any, Callable, TextIO
+
+try:
+    import orjson
+except ImportError:  # optional dependency
+    orjson = None
 
 from ._env import config
 from .utils import file_link, list_files
 
 _missing = object()
+_ENCODING_DETECTION_SAMPLE_SIZE = 64 * 1024
+_NON_ASCII_BYTES = bytes(range(0x80, 0x100))
+_MMAP_READ_MIN_SIZE = 4 * 1024 * 1024
+_WRITE_BUFFER_SIZE = 1 << 20
+_O_BINARY = getattr(os, "O_BINARY", 0)
+_COPY_MAX_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+_COPY_FILE_RANGE_UNSUPPORTED = {
+    errno.EXDEV,
+    errno.ENOSYS,
+    errno.EINVAL,
+    errno.EOPNOTSUPP,
+    errno.EPERM,
+}
+
+
+def _detect_encoding(data: bytes) -> str | None:
+    """
+    Detects text encoding, using charset-normalizer if installed
+    (significantly faster) or chardet otherwise.
+    """
+    # pylint: disable=import-outside-toplevel
+    try:
+        from charset_normalizer import from_bytes
+    except ImportError:
+        import chardet
+
+        return chardet.detect(data)["encoding"]
+    best = from_bytes(data).best()
+    return best.encoding if best else None
+
+
+def _json_loads(data: str):
+    """Parses JSON using orjson if installed, json module otherwise."""
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass  # json module also accepts NaN / Infinity and arbitrary large integers
+    return json.loads(data)
+
+
+def _to_bytes(text: str, encoding: str) -> bytes:
+    """Encodes text the same way as text-mode file writes (with newline translation)."""
+    if os.linesep != "\n":
+        text = text.replace("\n", os.linesep)
+    return text.encode(encoding)
+
+
+def _write_bytes(file_path: str | Path, data: bytes):
+    """Writes data to the file with unbuffered os.write() calls, truncating the file."""
+    fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | _O_BINARY, 0o666)
+    try:
+        view = memoryview(data)
+        while view:
+            written = os.write(fd, view[:_WRITE_BUFFER_SIZE])
+            view = view[written:]
+    finally:
+        os.close(fd)
+
+
+def _write_content(
+    file_path: Path,
+    content: str | Callable[[TextIO], Any],
+    encoding: str,
+    append: bool,
+):
+    """Writes text or content produced by the writer function to the file."""
+    if callable(content):
+        with open(
+            file_path,
+            mode="a" if append else "w",
+            encoding=encoding,
+            buffering=_WRITE_BUFFER_SIZE,
+        ) as file:
+            content(file)
+    elif append:
+        with file_path.open(mode="a", encoding=encoding) as file:
+            file.write(content)
+    else:
+        _write_bytes(file_path, _to_bytes(content, encoding))
+
+
+def _free_file_name(directory: Path, base_name: Path, ext: str) -> str:
+    """
+    Finds the first "{base_name}_{counter}{ext}" name not taken by a file,
+    base_name is relative to the directory.
+    """
+    # Single directory scan instead of probing each candidate name,
+    # names are compared case-insensitively as on Windows / macOS file systems
+    with os.scandir((directory / base_name).parent) as entries:
+        taken = {entry.name.casefold() for entry in entries if entry.is_file()}
+    counter = 1
+    while f"{base_name.name}_{counter}{ext}".casefold() in taken:
+        counter += 1
+    return f"{base_name}_{counter}{ext}"
+
+
+def _write_tmp_file(
+    directory: Path, writer: Callable[[TextIO], Any], encoding: str
+) -> Path:
+    """
+    Writes content to a new temporary file within the directory using the writer function.
+    The file is removed if writing fails.
+    """
+    directory.mkdir(parents=True, exist_ok=True)
+    tmp_file = directory / f".{uuid.uuid4().hex}.tmp"
+    # os.open() with 0o666 respects umask like regular file creation (unlike mkstemp)
+    fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_EXCL | _O_BINARY, 0o666)
+    try:
+        with open(
+            fd, mode="w", encoding=encoding, buffering=_WRITE_BUFFER_SIZE
+        ) as file:
+            writer(file)
+    except BaseException:
+        tmp_file.unlink(missing_ok=True)
+        raise
+    return tmp_file
+
+
+def _replace_with_tmp_file(tmp_file: Path, dst: Path):
+    """
+    Moves the temporary file over the destination,
+    keeping permissions of the existing file and writing through symbolic links.
+    """
+    dst = os.path.realpath(dst)
+    try:
+        if os.path.exists(dst):
+            shutil.copymode(dst, tmp_file)
+        os.replace(tmp_file, dst)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            tmp_file.unlink(missing_ok=True)
+            raise
+        # Symbolic link target is located on another file system
+        shutil.move(tmp_file, dst)
+
+
+def _compile_patterns(patterns: list[str | Path]) -> re.Pattern | None:
+    """
+    Fuses Unix shell-style wildcard patterns into a single regular expression.
+    Matching a name against it is equivalent to fnmatch.fnmatch() with any of the patterns.
+    """
+    if not patterns:
+        return None
+    return re.compile(
+        "|".join(fnmatch.translate(os.path.normcase(str(p))) for p in patterns)
+    )
+
+
+def _fast_copy(src: str | Path, dst: str | Path):
+    """
+    Copies file content and metadata like shutil.copy2(),
+    using in-kernel os.copy_file_range() where supported.
+    """
+    if os.path.exists(dst) and os.path.samefile(src, dst):
+        raise shutil.SameFileError(f"{src!r} and {dst!r} are the same file")
+    if hasattr(os, "copy_file_range"):
+        try:
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                src_fd, dst_fd = fsrc.fileno(), fdst.fileno()
+                size = os.fstat(src_fd).st_size
+                while os.copy_file_range(src_fd, dst_fd, max(size, 1 << 20)):
+                    pass
+            shutil.copystat(src, dst)
+            return
+        except OSError as e:
+            if e.errno not in _COPY_FILE_RANGE_UNSUPPORTED:
+                raise
+    shutil.copy2(src, dst)
+
+
+def _iter_files(root: str | Path, rel_dir: str = ""):
+    """
+    Recursively yields paths of files within `root` relative to it.
+    Symlinked directories are not followed (same as Path.rglob()).
+    """
+    with os.scandir(os.path.join(root, rel_dir)) as entries:
+        for entry in entries:
+            rel_path = os.path.join(rel_dir, entry.name)
+            if entry.is_dir(follow_symlinks=False):
+                yield from _iter_files(root, rel_path)
+            elif entry.is_file():
+                yield rel_path
 
 
 class Storage:
@@ -36,13 +231,12 @@ class Storage:
         return config().DEFAULT_ENCODING
 
     def exists(self, name: str | Path) -> bool:
-        if isinstance(name, Path):
-            name = name.as_posix()
         return (self.path / name).exists()
 
     def abs_path(self, name: str | Path) -> Path:
-        if os.path.isabs(name):
-            return Path(name)
+        name = name if isinstance(name, Path) else Path(name)
+        if name.is_absolute():
+            return name
         return self.path / name
 
     def relative_path(self, name: str | Path) -> Path:
@@ -51,34 +245,93 @@ class Storage:
         """
         return Path(name).relative_to(self.path)
 
-    def read(self, name: str | Path, encoding: str = None, default=_missing):
+    def _resolve_read_paths(self, name: str | Path) -> list[str]:
+        """
+        Returns candidate paths for reading the file: with default extension first
+        (if the name has no extension) and then without it.
+        """
         name = str(name)
+        if os.path.isabs(name) or name.startswith("./"):
+            return [name]
+        path = self.path
+        ext = self.default_ext
+        if ext and "." not in name:
+            return [f"{path}/{name}{ext}", f"{path}/{name}"]
+        return [f"{path}/{name}"]
+
+    def read(self, name: str | Path, encoding: str = None, default=_missing):
         encoding = encoding or self.default_encoding
-        if not os.path.isabs(name) and not name.startswith("./"):
-            if "." in name:
-                parts = name.split(".")
-                name = ".".join(parts[:-1])
-                ext = "." + parts[-1]
-            else:
-                ext = self.default_ext
-                if not self.exists(f"{name}{ext}"):
-                    ext = ""
-            name = f"{self.path}/{name}{ext}"
+        *candidates, last = self._resolve_read_paths(name)
+        # Open candidates directly instead of checking their existence first
+        for file_path in candidates:
+            try:
+                return self._read_file(file_path, encoding)
+            except FileNotFoundError:
+                pass
         try:
-            if encoding is None:
-                with open(name, "rb") as f:
-                    rawdata = f.read()
-                result = chardet.detect(rawdata)
-                encoding = result["encoding"]
-                return rawdata.decode(encoding)
-
-            with open(name, "r", encoding=encoding) as f:
-                return f.read()
+            return self._read_file(last, encoding)
         except FileNotFoundError as e:
             if default is not _missing:
                 return default
             raise e
 
+    @staticmethod
+    def _read_file(name: str, encoding: str | None) -> str:
+        if encoding is None:
+            with open(name, "rb") as f:
+                # Detect encoding using only the head of the file,
+                # running detection over the whole content is slow for large files
+                head = f.read(_ENCODING_DETECTION_SAMPLE_SIZE)
+                tail = f.read()
+            # Don't let a multibyte character cut at the sample end affect detection
+            sample = (head.rstrip(_NON_ASCII_BYTES) or head) if tail else head
+            encoding = _detect_encoding(sample) or "utf-8"
+            if tail and codecs.lookup(encoding).name == "ascii":
+                # Non-ASCII characters may follow the sample, utf-8 is a superset of ascii
+                encoding = "utf-8"
+            data = head + tail
+            try:
+                return data.decode(encoding)
+            except UnicodeDecodeError:
+                if not tail:
+                    raise
+            # The sample was not representative, detect using the whole content
+            return data.decode(_detect_encoding(data) or "utf-8")
+
+        with open(name, "rb") as f:
+            if os.fstat(f.fileno()).st_size > _MMAP_READ_MIN_SIZE:
+                # Decode large files directly from the memory-mapped file,
+                # avoiding an intermediate bytes copy in the heap.
+                # Files containing \r go through text mode for newline translation.
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    if mm.find(b"\r") == -1:
+                        return str(mm, encoding)
+            with io.TextIOWrapper(f, encoding=encoding) as text_file:
+                return text_file.read()
+
+    def read_mmap(self, name: str | Path) -> mmap.mmap:
+        """
+        Returns read-only memory-mapped content of the file.
+        Should be closed after usage, may be used as a context manager.
+
+        Raises:
+            ValueError: if the file is empty (empty files can't be memory-mapped)
+        """
+        *candidates, last = self._resolve_read_paths(name)
+        for file_path in candidates:
+            try:
+                return self._mmap_file(file_path)
+            except FileNotFoundError:
+                pass
+        return self._mmap_file(last)
+
+    @staticmethod
+    def _mmap_file(name: str) -> mmap.mmap:
+        with open(name, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                raise ValueError(f"Can't memory-map empty file {name}")
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
     def write_json(
         self,
         name: str | Path,
@@ -87,12 +340,16 @@ class Storage:
         backup_existing: bool = True,
         ensure_ascii: bool = False,
     ):
-        serialized_data = json.dumps(data, indent=4, ensure_ascii=ensure_ascii)
-        return self.write(name, serialized_data, rewrite_existing, backup_existing)
+        return self.write(
+            name,
+            lambda f: json.dump(data, f, indent=4, ensure_ascii=ensure_ascii),
+            rewrite_existing,
+            backup_existing,
+        )
 
     def read_json(self, name: str | Path, default=_missing):
         try:
-            return json.loads(self.read(name))
+            return _json_loads(self.read(name))
         except FileNotFoundError as e:
             if default is not _missing:
                 return default
@@ -117,13 +374,14 @@ class Storage:
     def write(
         self,
         name: str | Path,
-        content: str = _missing,
+        content: str | Callable[[TextIO], Any] = _missing,
         rewrite_existing: bool = None,
         backup_existing: bool = None,
         encoding: str = None,
         append: bool = False,
     ) -> str | os.PathLike:
         """
+        :param content: Text to write or a function writing content to the opened file
         :return: str File name for further usage
         """
         if rewrite_existing is None:
@@ -131,33 +389,32 @@ class Storage:
         if backup_existing is None:
             backup_existing = not append
         encoding = encoding or self.default_encoding
+        path, default_ext = self.path, self.default_ext
         if content == _missing:
             content = name
-            name = f"out{self.default_ext}"
+            name = f"out{default_ext}"
 
         base_name = Path(name).with_suffix("")
-        ext = Path(name).suffix or self.default_ext
+        ext = Path(name).suffix or default_ext
 
         file_name = f"{base_name}{ext}"
-        if (self.path / file_name).is_file() and (
-            backup_existing or not rewrite_existing
-        ):
-            counter = 1
-            while True:
-                file_name1 = f"{base_name}_{counter}{ext}"  # noqa
-                if not (self.path / file_name1).is_file():
-                    break
-                counter += 1
+        tmp_file = None
+        if callable(content) and not append:
+            # Write to a temporary file first: a failure in the middle of writing
+            # must not affect the existing file and its backups
+            tmp_file = _write_tmp_file((path / file_name).parent, content, encoding)
+        if (path / file_name).is_file() and (backup_existing or not rewrite_existing):
+            file_name1 = _free_file_name(path, base_name, ext)
             if not rewrite_existing:
                 file_name = file_name1
             elif backup_existing:
-                os.rename(self.path / file_name, self.path / file_name1)
-        (self.path / file_name).parent.mkdir(parents=True, exist_ok=True)
-        if append:
-            with (self.path / file_name).open(mode="a", encoding=encoding) as file:
-                file.write(content)
+                os.rename(path / file_name, path / file_name1)
+        dst = path / file_name
+        dst.parent.mkdir(parents=True, exist_ok=True)
+        if tmp_file:
+            _replace_with_tmp_file(tmp_file, dst)
         else:
-            (self.path / file_name).write_text(content, encoding=encoding)
+            _write_content(dst, content, encoding, append)
         return file_name
 
     def clean(self, path: str | Path):
@@ -216,26 +473,32 @@ class Storage:
                 List of Unix shell-style wildcard patterns relative to src.
                 These paths will be excluded from the copy. Defaults to None.
         """
-        src = self.path / Path(src)
-        dest = self.path / Path(dest)
-        exclude = exclude or []
+        path = self.path
+        src = path / src
+        dest = path / dest
+        exclude_re = _compile_patterns(exclude)
         if src.is_dir():
             dest.mkdir(parents=True, exist_ok=True)
-            files = list_files(src, exclude)
-            for f in files:
-                if (src / f).is_dir():
-                    (dest / f).mkdir(parents=True, exist_ok=True)
-                elif (src / f).is_file():
-                    (dest / f).parent.mkdir(parents=True, exist_ok=True)
-                    shutil.copy2(src / f, dest / f)
-                else:
-                    raise ValueError(f"{src / f} is not a file or directory")
+            files = [
+                f
+                for f in _iter_files(src)
+                if not (exclude_re and exclude_re.match(os.path.normcase(f)))
+            ]
+            for parent in {os.path.dirname(f) for f in files}:
+                (dest / parent).mkdir(parents=True, exist_ok=True)
+            # Copying is I/O-bound, so threads let many small files overlap
+            with ThreadPoolExecutor(max_workers=_COPY_MAX_WORKERS) as executor:
+                futures = [
+                    executor.submit(_fast_copy, src / f, dest / f) for f in files
+                ]
+                for future in futures:
+                    future.result()
         elif src.is_file():
-            if not any(fnmatch.fnmatch(src.name, pattern) for pattern in exclude):
+            if not (exclude_re and exclude_re.match(os.path.normcase(src.name))):
                 if dest.is_dir():
                     dest = dest / src.name
                 dest.parent.mkdir(parents=True, exist_ok=True)
-                shutil.copy2(src, dest)
+                _fast_copy(src, dest)
         else:
             raise ValueError(f"{src} is not a file or directory")
 
@@ -1,7 +1,32 @@
 import os
+from functools import lru_cache
+
 import jinja2
 from ..types import TplFunctionType
 
+_TPL_CACHE_SIZE = 1024
+_CACHEABLE_TYPES = (str, int, float, bool, type(None))
+
+
+def _to_cache_key(value):
+    """
+    Converts template parameter to a cache key, keeping the type
+    (True and 1 are equal and have the same hash, but render differently).
+    Raises TypeError for values that may change after caching.
+    """
+    if type(value) is tuple:  # pylint: disable=unidiomatic-typecheck
+        return tuple, tuple(_to_cache_key(i) for i in value)
+    if type(value) in _CACHEABLE_TYPES:
+        return type(value), value
+    raise TypeError(
+        f"Template parameter of type {type(value).__name__} is not cacheable"
+    )
+
+
+def _from_cache_key(key):
+    dtype, value = key
+    return tuple(_from_cache_key(i) for i in value) if dtype is tuple else value
+
 
 def make_jinja2_env(env) -> jinja2.Environment:
     return jinja2.Environment(
@@ -16,4 +41,19 @@ def make_tpl_function(env) -> TplFunctionType:
     def tpl(file: os.PathLike[str] | str, **kwargs) -> str:
         return env.jinja_env.get_template(file).render(**kwargs)
 
-    return tpl
+    if not env.config.PROMPT_TEMPLATES_CACHE:
+        return tpl
+
+    @lru_cache(maxsize=_TPL_CACHE_SIZE)
+    def render_cached(file: os.PathLike[str] | str, kwargs_key: tuple) -> str:
+        return tpl(file, **{k: _from_cache_key(v) for k, v in kwargs_key})
+
+    def cached_tpl(file: os.PathLike[str] | str, **kwargs) -> str:
+        try:
+            kwargs_key = tuple(sorted((k, _to_cache_key(v)) for k, v in kwargs.items()))
+        except TypeError:
+            return tpl(file, **kwargs)
+        return render_cached(file, kwargs_key)
+
+    cached_tpl.cache_clear = render_cached.cache_clear
+    return cached_tpl
@@ -1,6 +1,6 @@
 from typing import TYPE_CHECKING, Union
 
-from .._llm_functions import allm, llm
+from .._llm_functions import allm, llm, llm_parallel
 from ..utils import ExtendedString, ConvertableToMessage
 if TYPE_CHECKING:
     from .wrappers.llm_response_wrapper import LLMResponse  # noqa: F401
@@ -22,3 +22,14 @@ class PromptWrapper(ExtendedString, ConvertableToMessage):
         Send prompt to Large Language Model asynchronously, see `allm`
         """
         return await allm(self, **kwargs)
+
+    @classmethod
+    async def gather(
+        cls, prompts: list, max_concurrent_tasks: int = None, **kwargs
+    ) -> list[Union[str, "LLMResponse"]]:
+        """
+        Send multiple prompts to Large Language Model concurrently, see `llm_parallel`
+        """
+        return await llm_parallel(
+            prompts, max_concurrent_tasks=max_concurrent_tasks, **kwargs
+        )
@@ -0,0 +1 @@
+not a python code
\ No newline at end of file
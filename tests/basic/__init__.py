@@ -47,6 +47,16 @@ def mock_openai_chat(mocker):
         )
 
 
+class LetterCountEmbeddingFunction:
+    """Offline stub: embeds text as counts of latin letters"""
+
+    def __call__(self, input):  # noqa, argument name is required by chromadb
+        return [
+            [float(text.lower().count(c)) + 0.01 for c in "abcdefghijklmnopqrstuvwxyz"]
+            for text in input
+        ]
+
+
 class MockResponse(dict):
     def __init__(self, **entries):
         super().__init__(**entries)
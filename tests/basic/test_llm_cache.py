@@ -0,0 +1,138 @@
+import threading
+
+import pytest
+import microcore as mc
+from microcore._llm_cache import SEMANTIC_CACHE_COLLECTION
+from . import LetterCountEmbeddingFunction
+
+calls = 0
+
+
+def llm_func_counting_parrot(prompt, **kwargs):
+    global calls
+    calls += 1
+    return prompt
+
+
+@pytest.mark.asyncio
+async def test_llm_cache():
+    global calls
+    calls = 0
+    mc.configure(
+        USE_DOT_ENV=False,
+        LLM_API_TYPE=mc.ApiType.FUNCTION,
+        INFERENCE_FUNC=llm_func_counting_parrot,
+        CHAT_MODE=False,
+        LLM_CACHE_ENABLED=True,
+    )
+    assert mc.llm("ok") == "ok"
+    assert mc.llm("ok") == "ok"
+    assert await mc.allm("ok") == "ok"
+    assert calls == 1
+    assert mc.llm("ok").from_cache
+    assert mc.llm("ok", temperature=0.5) == "ok"
+    assert mc.llm("other") == "other"
+    assert calls == 3
+
+
+def test_llm_cache_disabled():
+    global calls
+    calls = 0
+    mc.configure(
+        USE_DOT_ENV=False,
+        LLM_API_TYPE=mc.ApiType.FUNCTION,
+        INFERENCE_FUNC=llm_func_counting_parrot,
+        CHAT_MODE=False,
+    )
+    mc.llm("ok")
+    mc.llm("ok")
+    assert calls == 2
+
+
+def test_llm_semantic_cache(tmp_path):
+    global calls
+    calls = 0
+    mc.configure(
+        USE_DOT_ENV=False,
+        LLM_API_TYPE=mc.ApiType.FUNCTION,
+        INFERENCE_FUNC=llm_func_counting_parrot,
+        CHAT_MODE=False,
+        STORAGE_PATH=str(tmp_path),
+        EMBEDDING_DB_FUNCTION=LetterCountEmbeddingFunction(),
+        LLM_CACHE_ENABLED=True,
+        LLM_CACHE_SEMANTIC_MAX_DISTANCE=0.5,
+    )
+    assert mc.llm("hello world") == "hello world"
+    assert calls == 1
+    # similar prompt: served from the embedding database
+    similar = mc.llm("hello world!")
+    assert similar == "hello world" and similar.from_cache
+    assert calls == 1
+    # different arguments: other cache context, not matched semantically
+    assert mc.llm("hello world!", temperature=0.5) == "hello world!"
+    assert calls == 2
+    # distant prompt: not matched
+    assert mc.llm("zzz qqq") == "zzz qqq"
+    assert calls == 3
+    assert mc.texts.count(SEMANTIC_CACHE_COLLECTION) == 3
+    # same prompt within another context: stored separately
+    assert mc.llm("hello world", temperature=0.7) == "hello world"
+    assert calls == 4
+    assert mc.texts.count(SEMANTIC_CACHE_COLLECTION) == 4
+    assert mc.llm("hello world!").from_cache
+    assert calls == 4
+
+
+@pytest.mark.asyncio
+async def test_llm_semantic_cache_async(tmp_path, mocker):
+    global calls
+    calls = 0
+    mc.configure(
+        USE_DOT_ENV=False,
+        LLM_API_TYPE=mc.ApiType.FUNCTION,
+        INFERENCE_FUNC=llm_func_counting_parrot,
+        CHAT_MODE=False,
+        STORAGE_PATH=str(tmp_path),
+        EMBEDDING_DB_FUNCTION=LetterCountEmbeddingFunction(),
+        LLM_CACHE_ENABLED=True,
+        LLM_CACHE_SEMANTIC_MAX_DISTANCE=0.5,
+    )
+    db_threads = set()
+
+    def record_thread(method):
+        def wrapper(*args, **kwargs):
+            db_threads.add(threading.current_thread())
+            return method(*args, **kwargs)
+
+        return wrapper
+
+    texts = mc.env().texts
+    mocker.patch.object(texts, "search", record_thread(texts.search))
+    mocker.patch.object(texts, "save_many", record_thread(texts.save_many))
+    assert await mc.allm("hello world") == "hello world"
+    similar = await mc.allm("hello world!")
+    assert similar == "hello world" and similar.from_cache
+    assert calls == 1
+    # embedding database is not accessed from the event loop thread
+    assert db_threads and threading.current_thread() not in db_threads
+
+
+def test_llm_cache_size(mocker):
+    global calls
+    calls = 0
+    mocker.patch("microcore._llm_cache.EXACT_CACHE_SIZE", 2)
+    mc.configure(
+        USE_DOT_ENV=False,
+        LLM_API_TYPE=mc.ApiType.FUNCTION,
+        INFERENCE_FUNC=llm_func_counting_parrot,
+        CHAT_MODE=False,
+        LLM_CACHE_ENABLED=True,
+    )
+    mc.llm("1")
+    mc.llm("2")
+    mc.llm("1")  # hit, "2" becomes the least recently used
+    mc.llm("3")  # evicts "2"
+    assert calls == 3
+    assert mc.llm("1").from_cache
+    mc.llm("2")
+    assert calls == 4
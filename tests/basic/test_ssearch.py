@@ -1,4 +1,8 @@
+import logging
+
+import microcore as mc
 from microcore import texts, env
+from . import LetterCountEmbeddingFunction
 
 
 def test_save_load():
@@ -139,3 +143,67 @@ def test_find_all():
         ],
     )
     assert 3 == len(texts.find_all(cid, "", {"field": "value_a"}))
+
+
+def test_search_many():
+    cid = "test_search_many"
+    texts.clear(cid)
+    texts.save_many(cid, ["cat", "dog", "catalog", "kit"])
+    results = texts.search_many(cid, ["kitty", "folder"], 2)
+    assert len(results) == 2
+    assert results[0][0] == "cat" and len(results[0]) == 2
+    assert results[1][0] == "catalog"
+    assert texts.search_many("test_search_many_non_existing", ["cat"]) == [[]]
+
+
+def test_use_gpu(tmp_path, mocker, caplog):
+    onnx_embedding_function = mocker.patch(
+        "chromadb.utils.embedding_functions.ONNXMiniLM_L6_V2"
+    )
+    get_providers = mocker.patch(
+        "onnxruntime.get_available_providers",
+        return_value=["CUDAExecutionProvider", "CPUExecutionProvider"],
+    )
+    mc.configure(
+        USE_DOT_ENV=False,
+        LLM_API_TYPE=mc.ApiType.FUNCTION,
+        INFERENCE_FUNC=lambda prompt, **kwargs: prompt,
+        CHAT_MODE=False,
+        STORAGE_PATH=str(tmp_path),
+        EMBEDDING_DB_USE_GPU=True,
+    )
+    assert mc.env().texts.embedding_function is onnx_embedding_function.return_value
+    onnx_embedding_function.assert_called_once_with(
+        preferred_providers=["CUDAExecutionProvider", "CPUExecutionProvider"]
+    )
+
+    onnx_embedding_function.reset_mock()
+    get_providers.return_value = ["CPUExecutionProvider"]
+    with caplog.at_level(logging.WARNING):
+        mc.env().init_similarity_search()
+    assert "no GPU execution providers found" in caplog.text
+    onnx_embedding_function.assert_called_once_with()
+
+
+def test_hnsw_params(tmp_path):
+    def configure(**hnsw_params):
+        mc.configure(
+            USE_DOT_ENV=False,
+            LLM_API_TYPE=mc.ApiType.FUNCTION,
+            INFERENCE_FUNC=lambda prompt, **kwargs: prompt,
+            CHAT_MODE=False,
+            STORAGE_PATH=str(tmp_path),
+            EMBEDDING_DB_FUNCTION=LetterCountEmbeddingFunction(),
+            EMBEDDING_DB_HNSW_PARAMS=hnsw_params,
+        )
+
+    configure(space="cosine", M=32)
+    texts.save("hnsw", "cat")
+    metadata = mc.env().texts.client.get_collection("hnsw").metadata
+    assert metadata["hnsw:space"] == "cosine" and metadata["hnsw:M"] == 32
+
+    # params changed: existing collection is still usable
+    configure(space="cosine", M=16, search_ef=50)
+    texts.save("hnsw", "dog")
+    assert texts.count("hnsw") == 2
+    assert texts.search("hnsw", "cat", 1) == ["cat"]
@@ -1,4 +1,7 @@
 import microcore as mc
+from pathlib import Path
+import shutil
+
 import pytest
 
 def test_storage_read_write():
@@ -148,4 +151,151 @@ def test_read_default():
 def test_read_json_default():
     assert mc.storage.read_json("non_existing_file", default={"default":"value"}) == {"default":"value"}
     with pytest.raises(FileNotFoundError):
-        mc.storage.read_json("non_existing_file")
\ No newline at end of file
+        mc.storage.read_json("non_existing_file")
+
+
+@pytest.mark.parametrize("encoding", ["utf-8", "cp1251"])
+def test_read_detect_encoding(encoding):
+    mc.storage.delete("tests_tmp")
+    text = (
+        "Файлове сховище зберігає тексти, шаблони та результати роботи моделей. "
+        "Кожен запис має назву, кодування та вміст, який можна прочитати пізніше.\n"
+    ) * 1000
+    mc.storage.write("tests_tmp/detect.txt", text, encoding=encoding)
+    mc.config().DEFAULT_ENCODING = None
+    try:
+        assert mc.storage.read("tests_tmp/detect.txt") == text
+    finally:
+        mc.config().DEFAULT_ENCODING = "utf-8"
+    mc.storage.delete("tests_tmp")
+
+
+def test_copy_nested():
+    mc.storage.delete("tests_tmp")
+    mc.storage.write("tests_tmp/src/a.txt", "a")
+    mc.storage.write("tests_tmp/src/sub/b.txt", "b")
+    mc.storage.write("tests_tmp/src/sub/deep/c.txt", "c")
+    mc.storage.write("tests_tmp/src/skip/d.txt", "d")
+    mc.storage.copy("tests_tmp/src", "tests_tmp/dst", ["skip/*"])
+    assert mc.storage.read("tests_tmp/dst/a.txt") == "a"
+    assert mc.storage.read("tests_tmp/dst/sub/b.txt") == "b"
+    assert mc.storage.read("tests_tmp/dst/sub/deep/c.txt") == "c"
+    assert not mc.storage.exists("tests_tmp/dst/skip")
+    mc.storage.delete("tests_tmp")
+
+
+def test_storage_write_backups():
+    mc.storage.delete("tests_tmp")
+    for i in range(4):
+        mc.storage.write("tests_tmp/file.txt", f"content {i}")
+    assert mc.storage.read("tests_tmp/file.txt") == "content 3"
+    assert mc.storage.read("tests_tmp/file_1.txt") == "content 0"
+    assert mc.storage.read("tests_tmp/file_3.txt") == "content 2"
+    mc.storage.delete("tests_tmp/file_2.txt")
+    mc.storage.write("tests_tmp/file.txt", "content 4")
+    assert mc.storage.read("tests_tmp/file_2.txt") == "content 3"
+    mc.storage.write("tests_tmp/Report_1.txt", "other")
+    mc.storage.write("tests_tmp/report.txt", "content 0")
+    mc.storage.write("tests_tmp/report.txt", "content 1")
+    assert mc.storage.read("tests_tmp/Report_1.txt") == "other"
+    assert mc.storage.read("tests_tmp/report_2.txt") == "content 0"
+    mc.storage.delete("tests_tmp")
+
+
+def test_read_large_file():
+    mc.storage.delete("tests_tmp")
+    text = "Ще один рядок тексту для великого файлу.\n" * 100000
+    mc.storage.write("tests_tmp/large.txt", text)
+    assert mc.storage.read("tests_tmp/large.txt") == text
+    mc.storage.write("tests_tmp/large_crlf.txt", text.replace("\n", "\r\n"))
+    assert mc.storage.read("tests_tmp/large_crlf.txt") == text
+    with mc.storage.read_mmap("tests_tmp/large.txt") as mm:
+        assert mm[:10] == text.encode()[:10]
+    mc.storage.write("tests_tmp/empty.txt", "")
+    with pytest.raises(ValueError):
+        mc.storage.read_mmap("tests_tmp/empty.txt")
+    mc.storage.delete("tests_tmp")
+
+
+def test_read_default_ext():
+    mc.storage.delete("tests_tmp")
+    prev_ext = mc.config().STORAGE_DEFAULT_FILE_EXT
+    mc.config().STORAGE_DEFAULT_FILE_EXT = ""
+    mc.storage.write("tests_tmp/no_ext", "no ext")
+    mc.config().STORAGE_DEFAULT_FILE_EXT = "txt"
+    try:
+        assert mc.storage.read("tests_tmp/no_ext") == "no ext"
+        mc.storage.write("tests_tmp/no_ext.txt", "with ext")
+        assert mc.storage.read("tests_tmp/no_ext") == "with ext"
+        assert mc.storage.read("tests_tmp/missing", default=None) is None
+    finally:
+        mc.config().STORAGE_DEFAULT_FILE_EXT = prev_ext
+    mc.storage.delete("tests_tmp")
+
+
+def test_read_json_special_values():
+    mc.storage.delete("tests_tmp")
+    mc.storage.write(
+        "tests_tmp/special.json", '{"nan": NaN, "big": 123456789012345678901234567890}'
+    )
+    data = mc.storage.read_json("tests_tmp/special.json")
+    assert data["nan"] != data["nan"]
+    assert data["big"] == 123456789012345678901234567890
+    mc.storage.delete("tests_tmp")
+
+
+def test_abs_path():
+    assert mc.storage.abs_path("file.txt") == mc.storage.path / "file.txt"
+    assert mc.storage.abs_path(Path("dir/file.txt")) == mc.storage.path / "dir/file.txt"
+    abs_file = Path(__file__).resolve()
+    assert mc.storage.abs_path(abs_file) == abs_file
+    assert mc.storage.abs_path(str(abs_file)) == abs_file
+
+
+def test_copy_same_file():
+    mc.storage.delete("tests_tmp")
+    mc.storage.write("tests_tmp/same.txt", "content")
+    with pytest.raises(shutil.SameFileError):
+        mc.storage.copy("tests_tmp/same.txt", "tests_tmp")
+    assert mc.storage.read("tests_tmp/same.txt") == "content"
+    mc.storage.delete("tests_tmp")
+
+
+def test_write_json_error_keeps_existing():
+    mc.storage.delete("tests_tmp")
+    mc.storage.write_json("tests_tmp/c.json", {"x": 1})
+    with pytest.raises(TypeError):
+        mc.storage.write_json("tests_tmp/c.json", {"x": 1, "y": object()})
+    assert mc.storage.read_json("tests_tmp/c.json") == {"x": 1}
+    assert [str(f) for f in mc.storage.list_files("tests_tmp")] == ["c.json"]
+    mc.storage.delete("tests_tmp")
+
+
+def test_write_json_keeps_mode_and_symlink():
+    mc.storage.delete("tests_tmp")
+    mc.storage.write_json("tests_tmp/c.json", {"x": 1})
+    path = mc.storage.path / "tests_tmp/c.json"
+    path.chmod(0o600)
+    mc.storage.write_json("tests_tmp/c.json", {"x": 2}, backup_existing=False)
+    assert mc.storage.read_json("tests_tmp/c.json") == {"x": 2}
+    assert path.stat().st_mode & 0o777 == 0o600
+    try:
+        (mc.storage.path / "tests_tmp/lnk.json").symlink_to("c.json")
+    except OSError:
+        pytest.skip("Symbolic links are not supported")
+    mc.storage.write_json("tests_tmp/lnk.json", {"x": 3}, backup_existing=False)
+    assert (mc.storage.path / "tests_tmp/lnk.json").is_symlink()
+    assert mc.storage.read_json("tests_tmp/c.json") == {"x": 3}
+    mc.storage.delete("tests_tmp")
+
+
+def test_read_detect_encoding_ascii_head():
+    mc.storage.delete("tests_tmp")
+    text = "a" * 70000 + "é"
+    mc.storage.write("tests_tmp/ascii_head.txt", text)
+    mc.config().DEFAULT_ENCODING = None
+    try:
+        assert mc.storage.read("tests_tmp/ascii_head.txt") == text
+    finally:
+        mc.config().DEFAULT_ENCODING = "utf-8"
+    mc.storage.delete("tests_tmp")
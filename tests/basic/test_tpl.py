@@ -1,5 +1,6 @@
 import json
 
+import microcore as mc
 from microcore import tpl
 from . import *  # noqa
 
@@ -16,3 +17,35 @@ def test_tpl_json(setup):  # noqa
 
 def test_tpl_subfolder(setup):  # noqa
     assert tpl("sub-folder/tpl.j2") == "tpl from sub-folder"
+
+
+def test_tpl_no_cache_by_default(setup):  # noqa
+    assert tpl("test.j2", var="val1") is not tpl("test.j2", var="val1")
+
+
+def test_tpl_cache(tmp_path):
+    class Obj:
+        v = 1
+
+    (tmp_path / "t.j2").write_text("{{ x }}")
+    (tmp_path / "obj.j2").write_text("{{ x.v }}")
+    mc.configure(
+        USE_DOT_ENV=False,
+        LLM_API_TYPE=mc.ApiType.NONE,
+        PROMPT_TEMPLATES_PATH=str(tmp_path),
+        PROMPT_TEMPLATES_CACHE=True,
+    )
+    assert tpl("t.j2", x=True) == "True"
+    assert tpl("t.j2", x=1) == "1"
+    assert tpl("t.j2", x=(1, "a")) == "(1, 'a')"
+    assert tpl("t.j2", x=(True, "a")) == "(True, 'a')"
+
+    obj = Obj()
+    assert tpl("obj.j2", x=obj) == "1"
+    obj.v = 2
+    assert tpl("obj.j2", x=obj) == "2"
+
+    (tmp_path / "t.j2").write_text("changed {{ x }}")
+    assert tpl("t.j2", x=1) == "1"
+    tpl.cache_clear()
+    assert tpl("t.j2", x=1) == "changed 1"
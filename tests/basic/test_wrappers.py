@@ -8,3 +8,12 @@ async def test_wrappers(setup):
 
     out = (await mc.tpl(file="json_data.j2", var="test_data").to_allm()).parse_json()
     assert out == dict(data="test_data")
+
+
+@pytest.mark.asyncio
+async def test_prompt_wrapper_gather(setup):
+    prompts = [mc.tpl(file="json_data.j2", var=f"data_{i}") for i in range(5)]
+    out = await mc.PromptWrapper.gather(prompts, max_concurrent_tasks=2)
+    assert [i.parse_json() for i in out] == [dict(data=f"data_{i}") for i in range(5)]
+    out = await mc.PromptWrapper.gather(prompts)
+    assert [i.parse_json() for i in out] == [dict(data=f"data_{i}") for i in range(5)]